@@ -4,15 +4,38 @@ Enhanced Epic Games Status & Deals Checker (Fixed Version)
 Monitors Epic Games services status and displays current free games/promotions
 """
 
+import heapq
+import orjson
+import random
 import requests
+import re
+import signal
 import time
 import sys
 import json
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from colorama import init, Fore, Style, Back
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from colorama import just_fix_windows_console, Fore, Style, Back
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Pattern, Sequence
+
+class NoColor:
+    """Stand-in for colorama's Fore/Back/Style that yields empty escape codes"""
+    
+    def __getattr__(self, name: str) -> str:
+        return ""
 
-init(autoreset=True)
+# Colors only make sense on a terminal; piped output stays plain text
+IS_TTY = sys.stdout.isatty()
+if IS_TTY:
+    # Native ANSI handling on Windows 10+, falling back to colorama's converter on older consoles
+    just_fix_windows_console()
+else:
+    Fore = Back = Style = NoColor()
 
 # Working API Endpoints (removed the 404 ones)
 EPIC_STATUS_URL = "https://status.epicgames.com/api/v2/summary.json"
@@ -28,12 +51,76 @@ EPIC_FREE_GAMES_URL = "https://store-site-backend-static.ak.epicgames.com/freeGa
 # EPIC_NEWS_URL = "https://status.epicgames.com/api/v2/news.json"
 # EPIC_INCIDENT_TYPES = "https://status.epicgames.com/api/v2/incident_types.json"
 
+# Only advertise brotli when it is installed, otherwise urllib3 cannot decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 HEADERS = {
     "User-Agent": "EpicGamesStatusChecker/Pro 3.0 (Enhanced Status Monitor)",
     "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
     "Accept-Language": "en-US,en;q=0.9"
 }
 
+# Seconds a fetched response is reused before hitting the endpoint again (URLs fetched by fetch_all)
+CACHE_TTL = {
+    EPIC_STATUS_URL: 30,
+    EPIC_INCIDENTS_URL: 30,
+    EPIC_FREE_GAMES_URL: 3600
+}
+
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+FREE_GAME_FIELDS = ("title", "description", "promotions")
+
+def slim_free_games(data: Dict) -> Dict:
+    """Keep only promoted games and the fields the free games view reads"""
+    games = data.get("data", {}).get("Catalog", {}).get("searchStore", {}).get("elements", [])
+    elements = [
+        {key: game[key] for key in FREE_GAME_FIELDS if key in game}
+        for game in games if game.get("promotions")
+    ]
+    return {"data": {"Catalog": {"searchStore": {"elements": elements}}}}
+
+# Applied to a freshly decoded body before it is cached, so only the needed subset stays in memory
+RESPONSE_FILTERS = {
+    EPIC_FREE_GAMES_URL: slim_free_games
+}
+
+# Retry/backoff limits; skip a cycle entirely once the error budget is spent
+MAX_RETRY_AFTER = 60
+ERROR_BUDGET = 10
+ERROR_WINDOW = 60
+
+# Adaptive polling: back off while everything is stable, poll quickly around incidents
+MAX_POLL_INTERVAL = 3600
+ALERT_POLL_INTERVAL = 60
+
+def keyword_pattern(keywords: Sequence[str], flags: int = 0) -> Pattern:
+    """Compile keywords into a single lowercase substring alternation"""
+    return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords), flags)
+
+# Key services and the compiled keyword pattern used to find their component
+SERVICES = tuple((name, keyword_pattern(keywords)) for name, keywords in [
+    ("Fortnite", ["fortnite"]),
+    ("Epic Games Store", ["store", "epic games store"]),
+    ("Login/Authentication", ["login", "account", "authentication", "auth"]),
+    ("Matchmaking", ["matchmaking", "game services", "lobby"]),
+    ("Friends & Social", ["friends", "social"]),
+    ("Cloud Save", ["cloud save", "save"]),
+    ("Downloads", ["download", "launcher"]),
+    ("Payment Processing", ["payment", "purchase"]),
+    ("Support System", ["support", "help"]),
+    ("Rocket League", ["rocket league"]),
+    ("Fall Guys", ["fall guys"])
+])
+
+EAC_KEYWORDS = ("anti", "cheat", "eac", "anticheat")
+EAC_PATTERN = keyword_pattern(EAC_KEYWORDS, re.IGNORECASE)  # also matches raw incident text
+
 STATUS_MAP = {
     "operational": (f"{Fore.GREEN}OPERATIONAL{Style.RESET_ALL}", "Everything is working normally"),
     "degraded_performance": (f"{Fore.YELLOW}DEGRADED PERFORMANCE{Style.RESET_ALL}", "Some services are slower than usual"),
@@ -43,58 +130,202 @@ STATUS_MAP = {
     "unknown": (f"{Fore.MAGENTA}UNKNOWN STATUS{Style.RESET_ALL}", "Status cannot be determined")
 }
 
+# Static render pieces, formatted once instead of on every cycle
+LABEL_CACHE = {
+    name: f"{Fore.WHITE}{name:<25}{Style.RESET_ALL}"
+    for name in tuple(service_name for service_name, _ in SERVICES) + ("Easy Anti-Cheat",)
+}
+
+SEPARATOR = "─" * 70
+
+BANNER = f"""
+{Fore.CYAN}╔══════════════════════════════════════════════════════════════════╗
+║                    EPIC GAMES MONITOR v3.1                        ║
+║     Status • Incidents • EAC • Free Games • More! (FIXED)         ║
+╚══════════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
+"""
+
+@lru_cache(maxsize=1024)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 API timestamp (accepting a trailing Z) as an aware datetime (UTC when no offset), cached per exact string"""
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def is_active(incident: Dict) -> bool:
+    """True for incidents that are not yet resolved"""
+    return not incident.get("resolved_at") and incident.get("status") != "resolved"
+
+def resolved_at(incident: Dict) -> datetime:
+    """Sort key for resolved incidents, oldest possible when missing, null or malformed"""
+    value = incident.get("resolved_at")
+    if not isinstance(value, str):
+        return datetime.min.replace(tzinfo=timezone.utc)
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+
+class JitteredRetry(Retry):
+    """urllib3 Retry with full-jitter exponential backoff and a capped Retry-After"""
+    
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER) + random.uniform(0, 1)
+
 class EpicGamesMonitor:
     def __init__(self):
         self.last_status_check = None
         self.last_free_games_check = None
         self.last_eac_status = None
+        self._cache: Dict[str, tuple] = {}  # url -> (expires_at, data)
+        self._validators: Dict[str, tuple] = {}  # url -> (conditional headers, data)
+        self._error_times: deque = deque()  # monotonic timestamps of failed requests
+        self._stable_cycles = 0
+        self._last_snapshot = None
+        self._wake_requested = False  # plain flag, safe to set from a signal handler
+        self._buf: List[str] = []  # lines of the frame being rendered
+        self.fetch_errors: Dict[str, str] = {}  # url -> error line from the last fetch_all
+        
+        # Shared session so every endpoint reuses pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        retries = JitteredRetry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                                allowed_methods=["GET", "HEAD"], respect_retry_after_header=True)
+        self.session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries))
+        
+        # Liveness probes must report the first response as-is, so they never retry
+        self.probe_session = requests.Session()
+        self.probe_session.headers.update(HEADERS)
+        self.probe_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
+        self.probe_session.close()
         
+    def record_error(self):
+        """Count a failed request against the rolling error budget"""
+        self._error_times.append(time.monotonic())
+
+    def circuit_open(self) -> bool:
+        """True when more than ERROR_BUDGET requests failed within ERROR_WINDOW seconds"""
+        cutoff = time.monotonic() - ERROR_WINDOW
+        while self._error_times and self._error_times[0] < cutoff:
+            self._error_times.popleft()
+        return len(self._error_times) > ERROR_BUDGET
+
+    def emit(self, text: str = ""):
+        """Queue a line for the current frame"""
+        self._buf.append(text + "\n")
+
+    def flush(self):
+        """Write the queued frame to stdout in one call"""
+        sys.stdout.write("".join(self._buf))
+        sys.stdout.flush()
+        self._buf.clear()
+
     def timestamp(self) -> str:
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     def make_request(self, url: str, timeout: int = 15) -> Optional[Dict]:
-        """Make HTTP request with error handling"""
+        """Make HTTP request with error handling, serving fresh cached responses"""
+        cached = self._cache.get(url)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        conditional_headers, last_data = self._validators.get(url, ({}, None))
+        
         try:
-            response = requests.get(url, headers=HEADERS, timeout=timeout)
-            response.raise_for_status()
-            return response.json()
+            response = self.session.get(url, headers=conditional_headers, timeout=timeout)
+            if response.status_code == 304 and last_data is not None:
+                # Unchanged since the last fetch, reuse the parsed body
+                data = last_data
+            else:
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                if url in RESPONSE_FILTERS:
+                    data = RESPONSE_FILTERS[url](data)
+                
+                validators = {}
+                if response.headers.get("ETag"):
+                    validators["If-None-Match"] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = response.headers["Last-Modified"]
+                if validators:
+                    self._validators[url] = (validators, data)
+            
+            # Server-provided max-age overrides the default TTL
+            ttl = CACHE_TTL.get(url, 0)
+            max_age = MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+            if max_age:
+                ttl = int(max_age.group(1))
+            if ttl > 0:
+                self._cache[url] = (time.monotonic() + ttl, data)
+            return data
         except requests.exceptions.Timeout:
-            print(f"{Fore.RED}Timeout fetching: {url}{Style.RESET_ALL}")
-            return None
+            message = f"Timeout fetching: {url}"
         except requests.exceptions.ConnectionError:
-            print(f"{Fore.RED}Connection error for: {url}{Style.RESET_ALL}")
-            return None
+            message = f"Connection error for: {url}"
+        except requests.exceptions.RetryError:
+            message = f"Gave up after repeated errors: {url}"
         except requests.exceptions.HTTPError as e:
-            print(f"{Fore.RED}HTTP Error {e.response.status_code}: {url}{Style.RESET_ALL}")
-            return None
-        except json.JSONDecodeError:
-            print(f"{Fore.RED}Invalid JSON response from: {url}{Style.RESET_ALL}")
-            return None
+            message = f"HTTP Error {e.response.status_code}: {url}"
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+            message = f"Invalid JSON response from: {url}"
         except Exception as e:
-            print(f"{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
-            return None
+            message = f"Unexpected error: {e}"
+        
+        # Kept for the section that renders this endpoint, since fetches finish before rendering
+        self.fetch_errors[url] = f"{Fore.RED}{message}{Style.RESET_ALL}"
+        self.record_error()
+        return None
+
+    def emit_fetch_error(self, url: str):
+        """Show why an endpoint could not be fetched, under the current section heading"""
+        if url in self.fetch_errors:
+            self.emit(self.fetch_errors[url])
 
     def print_banner(self):
         """Display enhanced banner"""
-        print(f"""
-{Fore.CYAN}╔══════════════════════════════════════════════════════════════════╗
-║                    EPIC GAMES MONITOR v3.1                        ║
-║     Status • Incidents • EAC • Free Games • More! (FIXED)         ║
-╚══════════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
-""")
-
-    def get_component_by_keywords(self, components: List[Dict], keywords: List[str]) -> Optional[Dict]:
-        """Find component by matching keywords in name"""
-        for comp in components:
-            name = comp.get("name", "").strip().lower()
-            if any(keyword.lower() in name for keyword in keywords):
-                return comp
-        return None
+        self.emit(BANNER)
+
+    def index_components(self, components: List[Dict]) -> tuple:
+        """Index components as one newline-joined lowercase name string plus name offsets"""
+        names = [comp.get("name", "").strip().lower() for comp in components]
+        starts = []
+        offset = 0
+        for name in names:
+            starts.append(offset)
+            offset += len(name) + 1
+        return "\n".join(names), starts, components
+
+    def get_component_by_keywords(self, index: tuple, pattern: Pattern) -> Optional[Dict]:
+        """Find the first component whose name matches the keyword pattern"""
+        names, starts, components = index
+        # The leftmost match in the joined names belongs to the first matching component
+        match = pattern.search(names)
+        if not match:
+            return None
+        return components[bisect_right(starts, match.start()) - 1]
 
     def print_service_status(self, label: str, component: Optional[Dict]):
         """Print formatted service status"""
+        label_display = LABEL_CACHE.get(label) or f"{Fore.WHITE}{label:<25}{Style.RESET_ALL}"
         if not component:
-            print(f"{Fore.WHITE}{label:<25}{Style.RESET_ALL}: {Fore.MAGENTA}NOT FOUND{Style.RESET_ALL}")
+            self.emit(f"{label_display}: {Fore.MAGENTA}NOT FOUND{Style.RESET_ALL}")
             return
             
         status = component.get("status", "unknown").lower()
@@ -102,22 +333,20 @@ class EpicGamesMonitor:
         
         # Add extra emphasis for outages
         if "outage" in status.lower():
-            print(f"{Back.RED}{Fore.WHITE} {label} {Style.RESET_ALL}: {status_display}")
+            self.emit(f"{Back.RED}{Fore.WHITE} {label} {Style.RESET_ALL}: {status_display}")
         else:
-            print(f"{Fore.WHITE}{label:<25}{Style.RESET_ALL}: {status_display}")
+            self.emit(f"{label_display}: {status_display}")
 
-    def display_system_status(self):
+    def display_system_status(self, status_data: Optional[Dict], components: Optional[tuple]):
         """Display comprehensive system status"""
-        print(f"\n{Back.BLUE}{Fore.WHITE} SYSTEM STATUS {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.BLUE}{Fore.WHITE} SYSTEM STATUS {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
-        # Get main status
-        status_data = self.make_request(EPIC_STATUS_URL)
         if not status_data:
-            print(f"{Fore.RED}Unable to fetch system status{Style.RESET_ALL}")
+            self.emit_fetch_error(EPIC_STATUS_URL)
+            self.emit(f"{Fore.RED}Unable to fetch system status{Style.RESET_ALL}")
             return
 
-        components = status_data.get("components", [])
         overall_status = status_data.get("page", {}).get("indicator", "none")
         
         # Overall status with warnings
@@ -126,41 +355,27 @@ class EpicGamesMonitor:
         else:
             overall_text = f"{Fore.RED}*** WARNING: ISSUES DETECTED ***{Style.RESET_ALL}"
         
-        print(f"{Fore.WHITE}Overall Status{Style.RESET_ALL}: {overall_text}")
-        print()
+        self.emit(f"{Fore.WHITE}Overall Status{Style.RESET_ALL}: {overall_text}")
+        self.emit()
 
         # Key services
-        services = [
-            ("Fortnite", ["fortnite"]),
-            ("Epic Games Store", ["store", "epic games store"]),
-            ("Login/Authentication", ["login", "account", "authentication", "auth"]),
-            ("Matchmaking", ["matchmaking", "game services", "lobby"]),
-            ("Friends & Social", ["friends", "social"]),
-            ("Cloud Save", ["cloud save", "save"]),
-            ("Downloads", ["download", "launcher"]),
-            ("Payment Processing", ["payment", "purchase"]),
-            ("Support System", ["support", "help"]),
-            ("Rocket League", ["rocket league"]),
-            ("Fall Guys", ["fall guys"])
-        ]
-
-        for service_name, keywords in services:
-            component = self.get_component_by_keywords(components, keywords)
+        for service_name, pattern in SERVICES:
+            component = self.get_component_by_keywords(components, pattern)
             self.print_service_status(service_name, component)
 
-    def display_components_detailed(self):
+    def display_components_detailed(self, components_data: Optional[Dict]):
         """Display all available components for detailed status"""
-        print(f"\n{Back.GREEN}{Fore.WHITE} DETAILED COMPONENTS STATUS {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.GREEN}{Fore.WHITE} DETAILED COMPONENTS STATUS {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
-        components_data = self.make_request(EPIC_COMPONENTS_URL)
         if not components_data:
-            print(f"{Fore.RED}Unable to fetch components data{Style.RESET_ALL}")
+            self.emit_fetch_error(EPIC_STATUS_URL)
+            self.emit(f"{Fore.RED}Unable to fetch components data{Style.RESET_ALL}")
             return
 
         components = components_data.get("components", [])
         if not components:
-            print(f"{Fore.YELLOW}No components data available{Style.RESET_ALL}")
+            self.emit(f"{Fore.YELLOW}No components data available{Style.RESET_ALL}")
             return
 
         # Group components by status
@@ -178,33 +393,30 @@ class EpicGamesMonitor:
 
         # Show issues first
         if issues:
-            print(f"{Fore.RED}COMPONENTS WITH ISSUES:{Style.RESET_ALL}")
+            self.emit(f"{Fore.RED}COMPONENTS WITH ISSUES:{Style.RESET_ALL}")
             for name, status in issues:
                 status_display, _ = STATUS_MAP.get(status, STATUS_MAP["unknown"])
-                print(f"  {Fore.WHITE}{name:<35}{Style.RESET_ALL}: {status_display}")
-            print()
+                self.emit(f"  {Fore.WHITE}{name:<35}{Style.RESET_ALL}: {status_display}")
+            self.emit()
 
         # Show operational count
         if operational:
-            print(f"{Fore.GREEN}{len(operational)} components operational{Style.RESET_ALL}")
+            self.emit(f"{Fore.GREEN}{len(operational)} components operational{Style.RESET_ALL}")
             # Optionally show first few operational components
             if len(operational) <= 5:
                 for name in operational:
-                    print(f"  {Fore.WHITE}{name:<35}{Style.RESET_ALL}: {Fore.GREEN}OPERATIONAL{Style.RESET_ALL}")
+                    self.emit(f"  {Fore.WHITE}{name:<35}{Style.RESET_ALL}: {Fore.GREEN}OPERATIONAL{Style.RESET_ALL}")
             else:
-                print(f"  Including: {', '.join(operational[:3])}, and {len(operational)-3} more...")
+                self.emit(f"  Including: {', '.join(operational[:3])}, and {len(operational)-3} more...")
 
-    def display_easy_anticheat_status(self):
+    def display_easy_anticheat_status(self, components: Optional[tuple], incidents_data: Optional[Dict]):
         """Display Easy Anti-Cheat specific monitoring"""
-        print(f"\n{Back.MAGENTA}{Fore.WHITE} EASY ANTI-CHEAT (EAC) STATUS {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.MAGENTA}{Fore.WHITE} EASY ANTI-CHEAT (EAC) STATUS {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
         # Check components for EAC
-        status_data = self.make_request(EPIC_STATUS_URL)
-        if status_data:
-            components = status_data.get("components", [])
-            eac_keywords = ["anti", "cheat", "eac", "easy anti", "anticheat"]
-            eac_component = self.get_component_by_keywords(components, eac_keywords)
+        if components:
+            eac_component = self.get_component_by_keywords(components, EAC_PATTERN)
             
             if eac_component:
                 self.print_service_status("Easy Anti-Cheat", eac_component)
@@ -212,110 +424,105 @@ class EpicGamesMonitor:
                 
                 # Check for status changes
                 if self.last_eac_status and self.last_eac_status != current_status:
-                    print(f"{Back.YELLOW}{Fore.BLACK} EAC STATUS CHANGE DETECTED {Style.RESET_ALL}")
-                    print(f"   Changed from: {self.last_eac_status} → {current_status}")
+                    self.emit(f"{Back.YELLOW}{Fore.BLACK} EAC STATUS CHANGE DETECTED {Style.RESET_ALL}")
+                    self.emit(f"   Changed from: {self.last_eac_status} → {current_status}")
                 
                 self.last_eac_status = current_status
             else:
-                print(f"{Fore.YELLOW}EAC status not found in components{Style.RESET_ALL}")
+                self.emit(f"{Fore.YELLOW}EAC status not found in components{Style.RESET_ALL}")
+        else:
+            self.emit_fetch_error(EPIC_STATUS_URL)
         
         # Check incidents for EAC-related issues
-        incidents_data = self.make_request(EPIC_INCIDENTS_URL)
         if incidents_data:
             incidents = incidents_data.get("incidents", [])
             eac_incidents = []
             
             for incident in incidents:
-                name = incident.get("name", "").lower()
                 updates = incident.get("incident_updates", [])
                 
-                if any(keyword in name for keyword in ["anti", "cheat", "eac", "anticheat"]):
+                # Check the incident name, then its updates, for EAC mentions
+                if EAC_PATTERN.search(incident.get("name", "")) or any(
+                        EAC_PATTERN.search(update.get("body", "")) for update in updates):
                     eac_incidents.append(incident)
-                    continue
-                
-                # Check incident updates for EAC mentions
-                for update in updates:
-                    body = update.get("body", "").lower()
-                    if any(keyword in body for keyword in ["anti", "cheat", "eac", "anticheat"]):
-                        eac_incidents.append(incident)
-                        break
             
             if eac_incidents:
-                print(f"\n{Fore.RED}EAC-Related Incidents Found:{Style.RESET_ALL}")
+                self.emit(f"\n{Fore.RED}EAC-Related Incidents Found:{Style.RESET_ALL}")
                 for incident in eac_incidents[:3]:
-                    print(f"  - {incident.get('name', 'Unknown Incident')}")
-                    print(f"    Status: {incident.get('status', 'unknown').title()}")
+                    self.emit(f"  - {incident.get('name', 'Unknown Incident')}")
+                    self.emit(f"    Status: {incident.get('status', 'unknown').title()}")
             else:
-                print(f"{Fore.GREEN}No EAC-related incidents detected{Style.RESET_ALL}")
+                self.emit(f"{Fore.GREEN}No EAC-related incidents detected{Style.RESET_ALL}")
+        else:
+            self.emit_fetch_error(EPIC_INCIDENTS_URL)
 
-    def display_incident_reports(self):
+    def display_incident_reports(self, incidents_data: Optional[Dict]):
         """Display comprehensive incident reports"""
-        print(f"\n{Back.RED}{Fore.WHITE} INCIDENT REPORTS {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.RED}{Fore.WHITE} INCIDENT REPORTS {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
-        incidents_data = self.make_request(EPIC_INCIDENTS_URL)
         if not incidents_data:
-            print(f"{Fore.RED}Unable to fetch incidents{Style.RESET_ALL}")
+            self.emit_fetch_error(EPIC_INCIDENTS_URL)
+            self.emit(f"{Fore.RED}Unable to fetch incidents{Style.RESET_ALL}")
             return
 
         incidents = incidents_data.get("incidents", [])
-        active_incidents = [i for i in incidents if not i.get("resolved_at") and i.get("status") != "resolved"]
+        active_incidents = [i for i in incidents if is_active(i)]
 
         if not active_incidents:
-            print(f"{Fore.GREEN}No active incidents reported{Style.RESET_ALL}")
+            self.emit(f"{Fore.GREEN}No active incidents reported{Style.RESET_ALL}")
         else:
             for idx, incident in enumerate(active_incidents[:5]):
                 impact = incident.get("impact", "unknown").upper()
                 impact_color = Fore.RED if impact == "CRITICAL" else Fore.YELLOW if impact == "MAJOR" else Fore.BLUE
                 
                 if impact == "CRITICAL":
-                    print(f"\n{Back.RED}{Fore.WHITE} CRITICAL INCIDENT {Style.RESET_ALL}")
+                    self.emit(f"\n{Back.RED}{Fore.WHITE} CRITICAL INCIDENT {Style.RESET_ALL}")
                 elif impact == "MAJOR":
-                    print(f"\n{Back.YELLOW}{Fore.BLACK} MAJOR INCIDENT {Style.RESET_ALL}")
+                    self.emit(f"\n{Back.YELLOW}{Fore.BLACK} MAJOR INCIDENT {Style.RESET_ALL}")
                 else:
-                    print()
+                    self.emit()
                 
-                print(f"{Fore.WHITE}{incident.get('name', 'Unknown Incident')}{Style.RESET_ALL}")
-                print(f"   Status: {impact_color}{incident.get('status', 'unknown').title()}{Style.RESET_ALL}")
-                print(f"   Impact: {impact_color}{impact}{Style.RESET_ALL}")
-                print(f"   Started: {Fore.LIGHTBLACK_EX}{incident.get('created_at', 'Unknown')}{Style.RESET_ALL}")
+                self.emit(f"{Fore.WHITE}{incident.get('name', 'Unknown Incident')}{Style.RESET_ALL}")
+                self.emit(f"   Status: {impact_color}{incident.get('status', 'unknown').title()}{Style.RESET_ALL}")
+                self.emit(f"   Impact: {impact_color}{impact}{Style.RESET_ALL}")
+                self.emit(f"   Started: {Fore.LIGHTBLACK_EX}{incident.get('created_at', 'Unknown')}{Style.RESET_ALL}")
                 
                 # Latest update
                 updates = incident.get("incident_updates", [])
                 if updates:
                     latest = updates[0]
-                    print(f"   Latest: {Fore.CYAN}{latest.get('body', 'No details')[:100]}{'...' if len(latest.get('body', '')) > 100 else ''}{Style.RESET_ALL}")
+                    self.emit(f"   Latest: {Fore.CYAN}{latest.get('body', 'No details')[:100]}{'...' if len(latest.get('body', '')) > 100 else ''}{Style.RESET_ALL}")
 
         # Show recent resolved incidents from the main incidents endpoint
         resolved_incidents = [i for i in incidents if i.get("resolved_at") or i.get("status") == "resolved"]
-        recent_resolved = sorted(resolved_incidents, key=lambda x: x.get("resolved_at", ""), reverse=True)[:3]
+        recent_resolved = heapq.nlargest(3, resolved_incidents, key=resolved_at)
         
         if recent_resolved:
-            print(f"\n{Fore.CYAN}Recently Resolved Incidents:{Style.RESET_ALL}")
+            self.emit(f"\n{Fore.CYAN}Recently Resolved Incidents:{Style.RESET_ALL}")
             for incident in recent_resolved:
-                print(f"  - {incident.get('name', 'Unknown')}")
+                self.emit(f"  - {incident.get('name', 'Unknown')}")
                 resolved_time = incident.get('resolved_at', 'Unknown')
                 if resolved_time and resolved_time != 'Unknown':
                     try:
                         # Parse and format the timestamp
-                        dt = datetime.fromisoformat(resolved_time.replace('Z', '+00:00'))
+                        dt = parse_timestamp(resolved_time)
                         formatted_time = dt.strftime('%Y-%m-%d %H:%M UTC')
-                        print(f"    Resolved: {Fore.GREEN}{formatted_time}{Style.RESET_ALL}")
+                        self.emit(f"    Resolved: {Fore.GREEN}{formatted_time}{Style.RESET_ALL}")
                     except:
-                        print(f"    Resolved: {Fore.GREEN}{resolved_time}{Style.RESET_ALL}")
+                        self.emit(f"    Resolved: {Fore.GREEN}{resolved_time}{Style.RESET_ALL}")
 
-    def display_free_games(self):
+    def display_free_games(self, free_games_data: Optional[Dict], now_utc: datetime):
         """Display current free games and promotions"""
-        print(f"\n{Back.GREEN}{Fore.WHITE} FREE GAMES & PROMOTIONS {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.GREEN}{Fore.WHITE} FREE GAMES & PROMOTIONS {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
-        free_games_data = self.make_request(EPIC_FREE_GAMES_URL)
         if not free_games_data:
-            print(f"{Fore.RED}Unable to fetch free games data{Style.RESET_ALL}")
+            self.emit_fetch_error(EPIC_FREE_GAMES_URL)
+            self.emit(f"{Fore.RED}Unable to fetch free games data{Style.RESET_ALL}")
             return
 
         games = free_games_data.get("data", {}).get("Catalog", {}).get("searchStore", {}).get("elements", [])
-        current_time = datetime.now(timezone.utc)
         
         free_games = []
         upcoming_games = []
@@ -334,8 +541,8 @@ class EpicGamesMonitor:
                     if discount_pct == 0:  # Free game
                         end_date = offer.get("endDate")
                         if end_date:
-                            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                            if end_dt > current_time:
+                            end_dt = parse_timestamp(end_date)
+                            if end_dt > now_utc:
                                 free_games.append((game, end_dt))
             
             # Check upcoming free games
@@ -345,41 +552,48 @@ class EpicGamesMonitor:
                     if discount_pct == 0:  # Free game
                         start_date = offer.get("startDate")
                         if start_date:
-                            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                            start_dt = parse_timestamp(start_date)
                             upcoming_games.append((game, start_dt))
 
         # Display current free games
         if free_games:
-            print(f"{Fore.GREEN}Currently FREE:{Style.RESET_ALL}")
+            self.emit(f"{Fore.GREEN}Currently FREE:{Style.RESET_ALL}")
             for game, end_date in free_games:
                 title = game.get("title", "Unknown Game")
                 description = game.get("description", "")[:60] + "..." if len(game.get("description", "")) > 60 else game.get("description", "")
-                days_left = (end_date - current_time).days
-                hours_left = (end_date - current_time).seconds // 3600
+                days_left, remainder = divmod(int((end_date - now_utc).total_seconds()), 86400)
+                hours_left = remainder // 3600
                 
-                print(f"  {Fore.CYAN}{title}{Style.RESET_ALL}")
-                print(f"     {Fore.LIGHTBLACK_EX}{description}{Style.RESET_ALL}")
+                self.emit(f"  {Fore.CYAN}{title}{Style.RESET_ALL}")
+                self.emit(f"     {Fore.LIGHTBLACK_EX}{description}{Style.RESET_ALL}")
                 
                 if days_left > 0:
-                    print(f"     Ends in {Fore.YELLOW}{days_left} days{Style.RESET_ALL} ({end_date.strftime('%Y-%m-%d %H:%M UTC')})")
+                    self.emit(f"     Ends in {Fore.YELLOW}{days_left} days{Style.RESET_ALL} ({end_date.strftime('%Y-%m-%d %H:%M UTC')})")
                 else:
-                    print(f"     Ends in {Fore.RED}{hours_left} hours{Style.RESET_ALL} ({end_date.strftime('%Y-%m-%d %H:%M UTC')})")
-                print()
+                    self.emit(f"     Ends in {Fore.RED}{hours_left} hours{Style.RESET_ALL} ({end_date.strftime('%Y-%m-%d %H:%M UTC')})")
+                self.emit()
         else:
-            print(f"{Fore.YELLOW}No free games currently available{Style.RESET_ALL}")
+            self.emit(f"{Fore.YELLOW}No free games currently available{Style.RESET_ALL}")
 
         # Display upcoming free games
         if upcoming_games:
-            print(f"{Fore.BLUE}Coming Soon:{Style.RESET_ALL}")
+            self.emit(f"{Fore.BLUE}Coming Soon:{Style.RESET_ALL}")
             for game, start_date in upcoming_games[:3]:  # Limit to next 3
                 title = game.get("title", "Unknown Game")
-                days_until = (start_date - current_time).days
-                print(f"  {Fore.MAGENTA}{title}{Style.RESET_ALL} - Starts in {Fore.CYAN}{days_until} days{Style.RESET_ALL}")
+                days_until = int((start_date - now_utc).total_seconds()) // 86400
+                self.emit(f"  {Fore.MAGENTA}{title}{Style.RESET_ALL} - Starts in {Fore.CYAN}{days_until} days{Style.RESET_ALL}")
+
+    def probe_endpoint(self, url: str) -> Optional[int]:
+        """Quick HEAD check without full parsing, returns None on connection failure"""
+        try:
+            return self.probe_session.head(url, timeout=10).status_code
+        except requests.exceptions.RequestException:
+            return None
 
     def display_api_status(self):
         """Display which API endpoints are working"""
-        print(f"\n{Back.YELLOW}{Fore.BLACK} API STATUS & INFO {Style.RESET_ALL}")
-        print("─" * 70)
+        self.emit(f"\n{Back.YELLOW}{Fore.BLACK} API STATUS & INFO {Style.RESET_ALL}")
+        self.emit(SEPARATOR)
         
         endpoints = [
             ("Summary API", EPIC_STATUS_URL),
@@ -389,55 +603,122 @@ class EpicGamesMonitor:
             ("Free Games API", EPIC_FREE_GAMES_URL)
         ]
         
+        # Probe all endpoints at once so the section costs a single round trip
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            status_codes = list(executor.map(self.probe_endpoint, [url for _, url in endpoints]))
+        
         working_count = 0
-        for name, url in endpoints:
-            # Quick check without full parsing
-            try:
-                response = requests.head(url, headers=HEADERS, timeout=10)
-                if response.status_code == 200:
-                    print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {name}")
-                    working_count += 1
-                else:
-                    print(f"  {Fore.RED}✗{Style.RESET_ALL} {name} (HTTP {response.status_code})")
-            except:
-                print(f"  {Fore.RED}✗{Style.RESET_ALL} {name} (Connection Error)")
+        for (name, _), status_code in zip(endpoints, status_codes):
+            if status_code == 200:
+                self.emit(f"  {Fore.GREEN}✓{Style.RESET_ALL} {name}")
+                working_count += 1
+            elif status_code is not None:
+                self.emit(f"  {Fore.RED}✗{Style.RESET_ALL} {name} (HTTP {status_code})")
+            else:
+                self.emit(f"  {Fore.RED}✗{Style.RESET_ALL} {name} (Connection Error)")
         
-        print(f"\n{Fore.CYAN}{working_count}/{len(endpoints)} API endpoints operational{Style.RESET_ALL}")
+        self.emit(f"\n{Fore.CYAN}{working_count}/{len(endpoints)} API endpoints operational{Style.RESET_ALL}")
         
         if working_count < len(endpoints):
-            print(f"{Fore.YELLOW}Note: Some Epic Games API endpoints appear to have been removed or changed.{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}This is common as companies update their APIs. The script has been updated to use working endpoints.{Style.RESET_ALL}")
+            self.emit(f"{Fore.YELLOW}Note: Some Epic Games API endpoints appear to have been removed or changed.{Style.RESET_ALL}")
+            self.emit(f"{Fore.YELLOW}This is common as companies update their APIs. The script has been updated to use working endpoints.{Style.RESET_ALL}")
 
     def display_footer(self, next_check: int):
         """Display footer with next check info"""
-        print(f"\n{Fore.WHITE}{'─' * 70}{Style.RESET_ALL}")
-        print(f"{Fore.LIGHTBLACK_EX}Last updated: {self.timestamp()}{Style.RESET_ALL}")
+        self.emit(f"\n{Fore.WHITE}{SEPARATOR}{Style.RESET_ALL}")
+        self.emit(f"{Fore.LIGHTBLACK_EX}Last updated: {self.timestamp()}{Style.RESET_ALL}")
         if next_check > 0:
-            print(f"{Fore.CYAN}Next check in {next_check} seconds... (Press Ctrl+C to exit){Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{'─' * 70}{Style.RESET_ALL}\n")
-
-    def run_single_check(self):
-        """Run a single comprehensive check"""
+            self.emit(f"{Fore.CYAN}Next check in {next_check} seconds... (Press Ctrl+C to exit){Style.RESET_ALL}")
+        self.emit(f"{Fore.WHITE}{SEPARATOR}{Style.RESET_ALL}\n")
+
+    def fetch_all(self) -> Dict[str, Optional[Dict]]:
+        """Fetch all data endpoints concurrently, keyed by URL"""
+        # The summary already embeds the full components list, so components.json is not fetched
+        urls = [EPIC_STATUS_URL, EPIC_INCIDENTS_URL, EPIC_FREE_GAMES_URL]
+        self.fetch_errors.clear()
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return dict(zip(urls, executor.map(self.make_request, urls)))
+
+    def run_single_check(self) -> Optional[Dict[str, Optional[Dict]]]:
+        """Run a single comprehensive check, returning the fetched data (None if skipped); the caller flushes"""
+        if self.circuit_open():
+            self.emit(f"{Fore.YELLOW}Too many recent request errors, skipping this check to let the API recover{Style.RESET_ALL}")
+            return None
+        
+        data = self.fetch_all()
+        now_utc = datetime.now(timezone.utc)  # single time baseline for this check
+        
+        # One component index per pass, shared by the system status and EAC lookups
+        status_data = data[EPIC_STATUS_URL]
+        components = self.index_components(status_data.get("components", [])) if status_data else None
+        
         self.print_banner()
-        self.display_system_status()
-        self.display_components_detailed()
-        self.display_easy_anticheat_status()
-        self.display_incident_reports()
-        self.display_free_games()
+        self.display_system_status(status_data, components)
+        self.display_components_detailed(status_data)
+        self.display_easy_anticheat_status(components, data[EPIC_INCIDENTS_URL])
+        self.display_incident_reports(data[EPIC_INCIDENTS_URL])
+        self.display_free_games(data[EPIC_FREE_GAMES_URL], now_utc)
         self.display_api_status()
+        return data
+
+    def next_poll_interval(self, poll_interval: int, data: Optional[Dict[str, Optional[Dict]]]) -> int:
+        """Double the interval for each stable all-operational cycle, shorten it on changes or incidents"""
+        status_data = data and data[EPIC_STATUS_URL]
+        incidents_data = data and data[EPIC_INCIDENTS_URL]
+        if not status_data or not incidents_data:
+            # Nothing reliable to adapt to
+            return poll_interval
+        
+        overall_status = status_data.get("page", {}).get("indicator", "none")
+        active_ids = tuple(i.get("id") for i in incidents_data.get("incidents", []) if is_active(i))
+        component_statuses = tuple(c.get("status") for c in status_data.get("components", []))
+        snapshot = (overall_status, active_ids, component_statuses)
+        
+        changed = self._last_snapshot is not None and snapshot != self._last_snapshot
+        self._last_snapshot = snapshot
+        
+        if changed or overall_status != "none" or active_ids:
+            self._stable_cycles = 0
+            return min(poll_interval, ALERT_POLL_INTERVAL)
+        
+        interval = min(poll_interval * 2 ** min(self._stable_cycles, 16), max(poll_interval, MAX_POLL_INTERVAL))
+        self._stable_cycles += 1
+        return interval
+
+    def wake(self, *_):
+        """Cut the current wait short and check immediately (also the SIGUSR1 handler)"""
+        # No locks here: the handler runs on the main thread, which may be inside wait()
+        self._wake_requested = True
+
+    def wait(self, seconds: int):
+        """Wait until a monotonic deadline, returning early if woken"""
+        deadline = time.monotonic() + seconds
+        while not self._wake_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Short slices keep Ctrl+C and wake requests responsive on every platform
+            time.sleep(min(remaining, 1))
+        self._wake_requested = False
 
     def run_monitoring(self, poll_interval: int = 300):  # Default 5 minutes
         """Run continuous monitoring"""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self.wake)
+        
         try:
             while True:
-                # Clear screen (works on most terminals)
-                print("\033[2J\033[H")
+                # Clear screen (works on most terminals), sent with the rest of the frame
+                if IS_TTY:
+                    self.emit("\033[2J\033[H")
                 
-                self.run_single_check()
-                self.display_footer(poll_interval)
+                data = self.run_single_check()
+                interval = self.next_poll_interval(poll_interval, data) if poll_interval > 0 else 0
+                self.display_footer(interval)
+                self.flush()
                 
-                if poll_interval > 0:
-                    time.sleep(poll_interval)
+                if interval > 0:
+                    self.wait(interval)
                 else:
                     break
                     
@@ -450,8 +731,11 @@ class EpicGamesMonitor:
 
 def main():
     """Main entry point"""
-    monitor = EpicGamesMonitor()
-    
+    with EpicGamesMonitor() as monitor:
+        run_cli(monitor)
+
+def run_cli(monitor: EpicGamesMonitor):
+    """Dispatch on command line arguments"""
     # Parse command line arguments
     if len(sys.argv) >= 2:
         if sys.argv[1] in ['-h', '--help', 'help']:
@@ -464,10 +748,13 @@ Usage:
   python3 {sys.argv[0]} --help
 
 Arguments:
-  interval    Seconds between checks (default: 300)
+  interval    Base seconds between checks (default: 300); backs off while
+              all systems stay operational, shortens during incidents
   --once      Run once and exit
   --help      Show this help message
 
+Send SIGUSR1 to a running monitor to trigger an immediate check.
+
 Features:
   - System Status Monitoring
   - Detailed Components List (replaces removed Services API)
@@ -490,6 +777,7 @@ Examples:
             return
         elif sys.argv[1] == '--once':
             monitor.run_single_check()
+            monitor.flush()
             return
         else:
             try: